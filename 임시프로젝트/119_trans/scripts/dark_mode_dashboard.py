@@ -9,9 +9,18 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State, callback
 from dash import dash_table
+from flask import Response, request
+import gc
+import gzip
+import hashlib
+import json
+import os
+import re
+import unicodedata
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 warnings.filterwarnings('ignore')
 
@@ -19,11 +28,75 @@ warnings.filterwarnings('ignore')
 from hospital_transfer_analyzer import HospitalTransferAnalyzer
 from hospital_transfer_charts import HospitalTransferCharts
 
+
+def normalize_hospital_name(name):
+    """병원명 변형(공백, 전각문자, 법인 접두어)을 하나의 키로 정규화"""
+    key = unicodedata.normalize('NFKC', str(name))
+    key = re.sub(r'\s+', '', key)
+    key = re.sub(r'^\((재|의|학|사|복|주)\)', '', key)
+    return key
+
+
+# 시도 정식 명칭 → 대시보드 표준 지역명 (hosp_list.json은 정식 명칭 사용)
+REGION_ALIASES = {
+    '서울특별시': '서울', '부산광역시': '부산', '대구광역시': '대구', '인천광역시': '인천',
+    '광주광역시': '광주', '대전광역시': '대전', '울산광역시': '울산', '세종특별자치시': '세종',
+    '경기도': '경기', '강원도': '강원', '강원특별자치도': '강원', '충청북도': '충북', '충청남도': '충남',
+    '전라북도': '전북', '전북특별자치도': '전북', '전라남도': '전남', '경상북도': '경북', '경상남도': '경남',
+    '제주도': '제주', '제주특별자치도': '제주'
+}
+
+
+def normalize_region_name(region):
+    """지역명을 표준 지역명(서울, 경기 등)으로 정규화. 값이 없으면 None"""
+    if region is None or pd.isna(region):
+        return None
+    region = str(region).strip()
+    return REGION_ALIASES.get(region, region)
+
+
+def get_resident_memory_mb():
+    """현재 프로세스의 상주 메모리(RSS, MB). 측정할 수 없으면 None"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    except ImportError:
+        pass
+
+    try:
+        with open('/proc/self/status', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
 class DarkModeDashboard:
-    def __init__(self):
+    def __init__(self, low_memory=False, cache_reloads=True):
+        # 저메모리 모드: 집계 결과만 상주시키고 원본 데이터프레임은 해제
+        self.low_memory = low_memory
+        # 저메모리 모드에서 병원별 상세용으로 다시 읽은 원본 컬럼을 캐시할지 여부 (끄면 선택마다 디스크에서 읽음)
+        self.cache_reloads = cache_reloads
+        self.memory_report = None
+
         self.group1_file = "data/그룹1_응급진료결과_24개월_통합.xlsx"
         self.group2_file = "data/그룹2_119구급차전원율_24개월_통합.xlsx"
         self.group3_file = "data/그룹3_일일환자내역_통합.xlsx"
+        self.hosp_list_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'public', 'data', 'hosp_list.json'
+        )
+        # 병원ID 레지스트리 (한 번 부여된 ID를 실행 간에 유지)
+        self.hospital_id_file = "data/병원ID_레지스트리.json"
+
+        # 그룹별 수치 컬럼
+        self.group1_numeric_cols = ['전체', '귀가_증상호전', '전원_병실부족', '입원_일반병실', '사망_DOA']
+        self.group2_numeric_cols = ['119구급차_중증응급환자수', '119구급차_중증응급환자_전원수']
+        self.institution_types = ['전체', '센터급', '기관급']
+
+        # 시작 시 독립 집계 동시 실행 스레드 수
+        self.max_panel_workers = os.cpu_count() or 4
 
         # 다크모드 색상 팔레트
         self.dark_bg = '#1e1e1e'
@@ -54,16 +127,47 @@ class DarkModeDashboard:
         self.group2_df = self.load_group2_data()
         self.group3_df = self.load_group3_data()
 
+        # 원본 파일 상태와 바이트 해시 (데이터셋 지문, 저메모리 모드 재로드 시 변경 여부 확인용)
+        self.source_stats = {group: self.source_stat(group) for group in ['group1', 'group2', 'group3']}
+        self.source_digests = {group: self.source_digest(group) for group in ['group1', 'group2', 'group3']}
+        self.reloaded_frames = {}
+
+        # 병원 사전 (이름 변형 → 정수 병원ID) 및 병원별 행 인덱스
+        self.hospital_names = []
+        self.hospital_info = {}
+        self.hospital_ids = {}
+        self.hospital_labels = []
+        self.ambiguous_hospital_names = {}
+        self.hospital_row_index = {}
+        self.build_hospital_index()
+
+        # 병원별 전원율 순위용 그룹2 수치 배열
+        self.group2_arrays = self.build_group2_arrays()
+
         # 병원사정 전원율 분석 초기화
         self.hospital_transfer_analyzer = None
         self.hospital_transfer_charts = None
         self.hospital_transfer_df = None
+        self.hospital_transfer_figures = {}
         self.init_hospital_transfer_analysis()
 
+        # 화면별 사전 집계 (모든 탭은 원본 대신 이 집계를 사용)
+        self.view_aggregates = self.build_view_aggregates()
+
+        # JSON API용 사전 집계
+        self.dataset_fingerprint = self.compute_dataset_fingerprint()
+        self.hospital_fingerprint = self.compute_hospital_fingerprint()
+        self.api_payloads = {}
+        self.init_api_aggregates()
+
+        if self.low_memory:
+            self.release_raw_frames()
+
         # Dash 앱 초기화
-        self.app = dash.Dash(__name__)
+        self.app = dash.Dash(__name__, suppress_callback_exceptions=True)
         self.setup_layout()
         self.setup_callbacks()
+        self.setup_api_routes()
 
     def apply_dark_theme(self, fig, title=None):
         """그래프에 다크모드 테마 적용"""
@@ -125,8 +229,7 @@ class DarkModeDashboard:
             df = pd.read_excel(self.group1_file, sheet_name='응급진료결과_통합')
             print(f"그룹1 데이터 로드 완료: {df.shape[0]} records")
 
-            numeric_cols = ['전체', '귀가_증상호전', '전원_병실부족', '입원_일반병실', '사망_DOA']
-            for col in numeric_cols:
+            for col in self.group1_numeric_cols:
                 if col in df.columns:
                     df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
 
@@ -141,8 +244,7 @@ class DarkModeDashboard:
             df = pd.read_excel(self.group2_file, sheet_name='119구급차전원율_통합')
             print(f"그룹2 데이터 로드 완료: {df.shape[0]} records")
 
-            numeric_cols = ['119구급차_중증응급환자수', '119구급차_중증응급환자_전원수']
-            for col in numeric_cols:
+            for col in self.group2_numeric_cols:
                 if col in df.columns:
                     df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
 
@@ -189,6 +291,245 @@ class DarkModeDashboard:
             print(f"그룹3 데이터 로드 실패: {e}")
             return pd.DataFrame()
 
+    def load_hospital_list(self):
+        """hosp_list.json 병원 목록 로드 (첫 행은 메타, 둘째 행은 컬럼 라벨 헤더)"""
+        try:
+            with open(self.hosp_list_file, encoding='utf-8') as f:
+                rows = json.load(f)
+
+            # 키 이름(추출일시, __EMPTY_n)은 내보낼 때마다 바뀔 수 있으므로 헤더 행의 라벨로 컬럼을 찾음
+            columns = {label: key for key, label in rows[1].items()}
+            fields = ['기관명', '기관코드', '의료기관분류', '지역']
+            missing = [field for field in fields if field not in columns]
+            if missing:
+                print(f"[WARNING] 병원 목록 헤더에 컬럼이 없습니다: {missing}")
+
+            hospitals = []
+            for row in rows[2:]:
+                name = row.get(columns.get('기관명'))
+                if name:
+                    hospitals.append({
+                        '병원명': name,
+                        '기관코드': row.get(columns.get('기관코드')),
+                        '의료기관분류': row.get(columns.get('의료기관분류')),
+                        '지역': row.get(columns.get('지역'))
+                    })
+            print(f"병원 목록 로드 완료: {len(hospitals)} hospitals")
+            return hospitals
+        except Exception as e:
+            print(f"[WARNING] 병원 목록 로드 실패: {e}")
+            return []
+
+    def load_hospital_registry(self):
+        """병원ID 레지스트리 로드 (파일이 없으면 빈 목록, 손상되었으면 None)"""
+        try:
+            with open(self.hospital_id_file, encoding='utf-8') as f:
+                entries = sorted(json.load(f)['hospitals'], key=lambda entry: entry['병원ID'])
+            if [entry['병원ID'] for entry in entries] != list(range(len(entries))):
+                raise ValueError("병원ID가 0부터 연속되지 않습니다")
+            return entries
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"[WARNING] 병원ID 레지스트리 로드 실패 (이번 실행의 ID는 저장하지 않음): {e}")
+            return None
+
+    def save_hospital_registry(self, entries):
+        """병원ID 레지스트리 저장 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            os.makedirs(os.path.dirname(self.hospital_id_file) or '.', exist_ok=True)
+            temp_file = f"{self.hospital_id_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'hospitals': entries}, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.hospital_id_file)
+        except Exception as e:
+            print(f"[WARNING] 병원ID 레지스트리 저장 실패: {e}")
+
+    def build_hospital_index(self):
+        """세 그룹과 hosp_list.json을 잇는 정수 병원ID 사전 및 병원별 행 오프셋 인덱스 생성"""
+        tables = {
+            'group1': (self.group1_df, '의료기관명'),
+            'group2': (self.group2_df, '의료기관명'),
+            'group3': (self.group3_df, '추출병원명')
+        }
+
+        # ID는 레지스트리에 기록된 값을 그대로 쓰고 처음 보는 병원만 뒤에 추가한다.
+        # hosp_list.json 병원은 기관코드로 찾고, 이름이 같아도 다른 기관코드를 가진 항목과는 합치지 않는다.
+        registry = self.load_hospital_registry()
+        entries = registry if registry is not None else []
+        code_to_id = {entry['기관코드']: entry['병원ID'] for entry in entries if entry.get('기관코드')}
+        key_to_ids = {}
+        for entry in entries:
+            for key in entry['이름키']:
+                key_to_ids.setdefault(key, []).append(entry['병원ID'])
+        changed = False
+
+        def new_entry(name, code=None):
+            nonlocal changed
+            hospital_id = len(entries)
+            entries.append({'병원ID': hospital_id, '병원명': name, '기관코드': code, '이름키': []})
+            if code:
+                code_to_id[code] = hospital_id
+            changed = True
+            return hospital_id
+
+        def add_name_key(hospital_id, key):
+            nonlocal changed
+            ids = key_to_ids.setdefault(key, [])
+            if hospital_id not in ids:
+                ids.append(hospital_id)
+                entries[hospital_id]['이름키'].append(key)
+                changed = True
+
+        for hospital in self.load_hospital_list():
+            name, code = hospital['병원명'], hospital['기관코드']
+            key = normalize_hospital_name(name)
+            hospital_id = code_to_id.get(code) if code else None
+            if hospital_id is None:
+                # 이름으로만 등록된(기관코드 없는) 이전 항목이 있으면 그 ID를 이어받음
+                unclaimed = [
+                    candidate for candidate in key_to_ids.get(key, [])
+                    if candidate not in self.hospital_info and not (code and entries[candidate].get('기관코드'))
+                ]
+                if unclaimed:
+                    hospital_id = unclaimed[0]
+                    if code:
+                        entries[hospital_id]['기관코드'] = code
+                        code_to_id[code] = hospital_id
+                        changed = True
+                else:
+                    hospital_id = new_entry(name, code)
+            add_name_key(hospital_id, key)
+            self.hospital_info[hospital_id] = hospital
+
+        def resolve(variant, region=None):
+            """이름(+지역)으로 병원ID 결정 - 같은 이름의 병원이 여럿이면 지역으로 구분하고, 구분할 수 없으면 None"""
+            key = normalize_hospital_name(variant)
+            ids = key_to_ids.get(key)
+            if not ids:
+                hospital_id = new_entry(variant)
+                add_name_key(hospital_id, key)
+                return hospital_id
+            if len(ids) == 1:
+                return ids[0]
+            matches = [
+                candidate for candidate in ids
+                if region is not None
+                and normalize_region_name(self.hospital_info.get(candidate, {}).get('지역')) == region
+            ]
+            return matches[0] if len(matches) == 1 else None
+
+        # 그룹 데이터의 병원명 → 병원ID (-1 = 병원명 없음 또는 동명 병원 구분 불가)
+        table_ids = {}
+        for group, (df, name_col) in tables.items():
+            if df.empty or name_col not in df.columns:
+                continue
+
+            # 고유 이름만 사전 조회하고 행 단위로는 정수 배열 인덱싱만 수행
+            codes, uniques = pd.factorize(df[name_col].astype(str).where(df[name_col].notna()))
+            lookup = np.full(len(uniques) + 1, -1, dtype=np.int32)
+            ambiguous_codes = []
+            for code, variant in enumerate(uniques):
+                hospital_id = resolve(variant)
+                if hospital_id is None:
+                    ambiguous_codes.append(code)
+                else:
+                    lookup[code] = hospital_id
+                    self.hospital_ids[variant] = hospital_id
+            row_ids = lookup[codes]
+
+            # 같은 이름이 여러 기관코드에 해당하는 행은 (이름, 지역)으로 구분
+            regions = df['지역'].to_numpy() if '지역' in df.columns else np.full(len(df), None, dtype=object)
+            for code in ambiguous_codes:
+                variant = uniques[code]
+                rows = np.flatnonzero(codes == code)
+                by_region = {}
+                for row in rows:
+                    region = normalize_region_name(regions[row])
+                    if region not in by_region:
+                        by_region[region] = resolve(variant, region)
+                    if by_region[region] is not None:
+                        row_ids[row] = by_region[region]
+
+                unresolved = sorted(region or '없음' for region, hospital_id in by_region.items() if hospital_id is None)
+                if unresolved:
+                    self.ambiguous_hospital_names[variant] = sorted(key_to_ids[normalize_hospital_name(variant)])
+                    print(f"[WARNING] 동명 병원 구분 불가 ({group} '{variant}', 지역 {', '.join(unresolved)}): "
+                          f"{int(np.count_nonzero(row_ids[rows] < 0))}행 병원ID 미지정")
+            table_ids[group] = row_ids
+
+        # 대표 이름: hosp_list.json의 현재 기관명, 없으면 레지스트리에 처음 기록된 이름
+        self.hospital_names = [entry['병원명'] for entry in entries]
+        for hospital_id, hospital in self.hospital_info.items():
+            self.hospital_names[hospital_id] = hospital['병원명']
+
+        # 화면 표시용 이름: 같은 이름의 병원이 여럿이면 지역을 덧붙여 구분
+        name_counts = pd.Series(self.hospital_names).value_counts()
+        self.hospital_labels = [
+            f"{name} ({self.hospital_info.get(hospital_id, {}).get('지역') or '지역 미상'})"
+            if name_counts[name] > 1 else name
+            for hospital_id, name in enumerate(self.hospital_names)
+        ]
+
+        if changed and registry is not None:
+            self.save_hospital_registry(entries)
+
+        id_dtype = np.int16 if len(self.hospital_names) < np.iinfo(np.int16).max else np.int32
+        n_hospitals = len(self.hospital_names)
+
+        for group, row_ids in table_ids.items():
+            hospital_id = row_ids.astype(id_dtype)
+            tables[group][0]['병원ID'] = hospital_id
+
+            # CSR 형태 인덱스: order[offsets[h]:offsets[h + 1]] 가 병원 h의 행 위치
+            order = np.argsort(hospital_id, kind='stable').astype(np.int32)
+            counts = np.bincount(hospital_id[hospital_id >= 0], minlength=n_hospitals)
+            offsets = np.zeros(n_hospitals + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+            offsets += np.count_nonzero(hospital_id < 0)
+            self.hospital_row_index[group] = {'order': order, 'offsets': offsets}
+
+        print(f"[OK] 병원 사전 생성 완료: {n_hospitals}개 병원, {len(self.hospital_ids)}개 이름 변형")
+
+    def get_hospital_rows(self, group, hospital_id):
+        """병원ID에 해당하는 그룹 데이터의 행 위치 배열"""
+        index = self.hospital_row_index.get(group)
+        if index is None or not 0 <= hospital_id < len(self.hospital_names):
+            return np.empty(0, dtype=np.int32)
+        offsets = index['offsets']
+        return index['order'][offsets[hospital_id]:offsets[hospital_id + 1]]
+
+    def count_hospitals(self, group):
+        """그룹 데이터에 등장하는 병원 수 (행 오프셋 인덱스 기준)"""
+        index = self.hospital_row_index.get(group)
+        if index is None:
+            return 0
+        return int(np.count_nonzero(np.diff(index['offsets'])))
+
+    def build_group2_arrays(self):
+        """병원ID/지역/연월 코드와 환자수/전원수를 정수·실수 배열로 보관 (순위 계산용)"""
+        required = ['병원ID', '지역', '연월'] + self.group2_numeric_cols
+        if self.group2_df.empty or not all(col in self.group2_df.columns for col in required):
+            return None
+
+        try:
+            # 연월이 비어 있는 행은 코드 -1 (순위 계산 마스크에서 제외)
+            region_codes, regions = pd.factorize(self.group2_df['지역'])
+            month_codes, months = pd.factorize(self.group2_df['연월'], sort=True)
+
+            return {
+                'hospital': self.group2_df['병원ID'].to_numpy().astype(np.int32),
+                'region': region_codes.astype(np.int32),
+                'month': month_codes.astype(np.int32),
+                'patients': self.group2_df['119구급차_중증응급환자수'].to_numpy(dtype=np.float64),
+                'transfers': self.group2_df['119구급차_중증응급환자_전원수'].to_numpy(dtype=np.float64),
+                'regions': {region: code for code, region in enumerate(regions)},
+                'months': list(months)
+            }
+        except Exception as e:
+            print(f"[WARNING] 전원율 순위용 배열 생성 실패: {e}")
+            return None
+
     def init_hospital_transfer_analysis(self):
         """병원사정 전원율 분석 초기화"""
         try:
@@ -198,18 +539,383 @@ class DarkModeDashboard:
                     self.hospital_transfer_analyzer
                 )
                 if hasattr(self.hospital_transfer_analyzer, 'df') and self.hospital_transfer_analyzer.df is not None:
-                    self.hospital_transfer_df = self.hospital_transfer_analyzer.df.copy()
+                    self.hospital_transfer_df = self.hospital_transfer_analyzer.df
+
+                # 기관유형별 월별 트렌드 차트를 미리 생성 (탭/API 공용)
+                for institution_type in self.institution_types:
+                    try:
+                        self.hospital_transfer_figures[institution_type] = \
+                            self.hospital_transfer_charts.create_monthly_trend_chart(institution_type=institution_type)
+                    except Exception as chart_error:
+                        print(f"[WARNING] 병원사정 차트 생성 실패 ({institution_type}): {chart_error}")
                 print("[OK] 병원사정 분석 초기화 완료")
             else:
                 print("[WARNING] 병원사정 분석 데이터를 로드할 수 없습니다")
         except Exception as e:
             print(f"[WARNING] 병원사정 분석 초기화 실패: {e}")
 
+    def run_parallel(self, tasks):
+        """시작 시 원본 데이터에 대한 독립 집계 작업({이름: 인자 없는 함수})을 스레드 풀에서 실행
+
+        요청 경로의 화면 렌더링은 작은 사전 집계만 다루므로 스레드 전환 비용이 더 커 사용하지 않는다.
+        풀은 호출마다 만들어 fork 이후에도 남은 스레드에 의존하지 않는다.
+        """
+        if len(tasks) <= 1 or self.max_panel_workers <= 1:
+            return {name: task() for name, task in tasks.items()}
+
+        with ThreadPoolExecutor(max_workers=min(len(tasks), self.max_panel_workers),
+                                thread_name_prefix='panel') as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def aggregate_region_month(self, df, value_cols):
+        """지역 × 연월 합계 데이터프레임"""
+        if df.empty or '연월' not in df.columns or '지역' not in df.columns:
+            return pd.DataFrame()
+
+        value_cols = [col for col in value_cols if col in df.columns]
+        return df.groupby(['지역', '연월'], dropna=False)[value_cols].sum().reset_index()
+
+    def build_view_aggregates(self):
+        """각 탭이 필요로 하는 집계 결과를 미리 계산 (그룹별 집계는 동시 실행)"""
+        def group3_classification():
+            if not self.group3_df.empty and '병원분류' in self.group3_df.columns:
+                return self.group3_df['병원분류'].value_counts()
+            return pd.Series(dtype='int64')
+
+        def date_range():
+            if not self.group1_df.empty and '연월' in self.group1_df.columns:
+                return f"{self.group1_df['연월'].min()} ~ {self.group1_df['연월'].max()}"
+            return "N/A"
+
+        results = self.run_parallel({
+            'group1_monthly': lambda: self.aggregate_region_month(self.group1_df, self.group1_numeric_cols),
+            'group2_monthly': lambda: self.aggregate_region_month(self.group2_df, self.group2_numeric_cols),
+            'group3_classification': group3_classification,
+            'group1_total_patients': lambda: self.group1_df['전체'].sum() if '전체' in self.group1_df.columns else 0,
+            'group2_total_patients': lambda: (self.group2_df['119구급차_중증응급환자수'].sum()
+                                              if '119구급차_중증응급환자수' in self.group2_df.columns else 0),
+            'date_range': date_range
+        })
+
+        return {
+            'group1_monthly': results['group1_monthly'],
+            'group2_monthly': results['group2_monthly'],
+            'group3_classification': results['group3_classification'],
+            'summary': {
+                'group1_records': len(self.group1_df),
+                'group2_records': len(self.group2_df),
+                'group3_records': len(self.group3_df),
+                'group1_hospitals': self.count_hospitals('group1'),
+                'group2_hospitals': self.count_hospitals('group2'),
+                'group1_total_patients': results['group1_total_patients'],
+                'group2_total_patients': results['group2_total_patients'],
+                'date_range': results['date_range']
+            }
+        }
+
+    def get_monthly_series(self, key, selected_region, value_cols):
+        """사전 집계(지역 × 연월)에서 선택 지역의 연월별 합계 계산"""
+        aggregate = self.view_aggregates[key]
+        if aggregate.empty:
+            return aggregate
+
+        if selected_region != '전체':
+            aggregate = aggregate[aggregate['지역'] == selected_region]
+        return aggregate.groupby('연월')[value_cols].sum().reset_index().sort_values('연월')
+
+    def source_stat(self, group):
+        """그룹 원본 파일의 (수정 시각, 크기) - 파일이 없으면 None"""
+        try:
+            stat = os.stat(getattr(self, f"{group}_file"))
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def source_digest(self, group):
+        """그룹 원본 파일 바이트의 SHA-1 (로더가 만드는 파생 컬럼과 무관하게 재시작 간 동일) - 파일이 없으면 'missing'"""
+        digest = hashlib.sha1()
+        try:
+            with open(getattr(self, f"{group}_file"), 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        except OSError:
+            return 'missing'
+        return digest.hexdigest()
+
+    def get_group_frame(self, group):
+        """그룹 원본 데이터 반환 (저메모리 모드에서는 디스크에서 다시 읽고 병원별 상세에 필요한 컬럼만 캐시)"""
+        df = getattr(self, f"{group}_df")
+        if df is not None:
+            return df
+
+        stat = self.source_stat(group)
+        cached = self.reloaded_frames.get(group)
+        if cached is not None and cached[0] == stat:
+            return cached[1]
+
+        # 행 오프셋 인덱스는 최초 로드 시점의 행 순서를 가리키므로 파일이 바뀌었으면 바이트 해시까지 같아야 사용 가능
+        if stat != self.source_stats.get(group) and self.source_digest(group) != self.source_digests.get(group):
+            print(f"[WARNING] {group} 원본 파일이 변경되어 병원별 행 인덱스와 맞지 않습니다 (재시작 필요)")
+            return pd.DataFrame()
+
+        loaders = {
+            'group1': self.load_group1_data,
+            'group2': self.load_group2_data,
+            'group3': self.load_group3_data
+        }
+        df = loaders[group]()
+
+        detail_columns = {
+            'group1': ['연월', '전체'],
+            'group2': ['연월'] + self.group2_numeric_cols,
+            'group3': ['병원분류']
+        }
+        df = df[[col for col in detail_columns[group] if col in df.columns]]
+        if self.cache_reloads:
+            self.reloaded_frames[group] = (stat, df)
+            print(f"[INFO] {group} 원본 컬럼 캐시: {df.memory_usage(deep=True).sum() / 1024 ** 2:,.2f} MB "
+                  f"(--memory-report 수치 이후 추가 상주)")
+        return df
+
+    def frame_memory_mb(self):
+        """상주 중인 데이터프레임/배열의 메모리 사용량(MB)"""
+        usage = {}
+        for name in ['group1_df', 'group2_df', 'group3_df', 'hospital_transfer_df']:
+            df = getattr(self, name)
+            usage[name] = df.memory_usage(deep=True).sum() / 1024 ** 2 if df is not None else 0.0
+
+        aggregates = [value for value in self.view_aggregates.values() if isinstance(value, (pd.DataFrame, pd.Series))]
+        usage['view_aggregates'] = sum(
+            value.memory_usage(deep=True).sum() if isinstance(value, pd.DataFrame) else value.memory_usage(deep=True)
+            for value in aggregates
+        ) / 1024 ** 2
+        usage['group2_arrays'] = sum(
+            value.nbytes for value in (self.group2_arrays or {}).values() if isinstance(value, np.ndarray)
+        ) / 1024 ** 2
+        usage['hospital_row_index'] = sum(
+            index['order'].nbytes + index['offsets'].nbytes for index in self.hospital_row_index.values()
+        ) / 1024 ** 2
+        # 미리 생성한 병원사정 차트는 직렬화 크기로 근사
+        usage['hospital_transfer_figures'] = sum(
+            len(figure.to_json()) for figure in self.hospital_transfer_figures.values()
+        ) / 1024 ** 2
+        # 병원별 상세 재로드 캐시 (원본 컬럼 일부, 첫 조회 이후 생김)
+        usage['reloaded_frames'] = sum(
+            df.memory_usage(deep=True).sum() for _, df in self.reloaded_frames.values()
+        ) / 1024 ** 2
+        return usage
+
+    def release_raw_frames(self):
+        """원본 데이터프레임을 해제하고 해제 전후 메모리 보고서 기록"""
+        before_frames = self.frame_memory_mb()
+        before_rss = get_resident_memory_mb()
+
+        self.group1_df = None
+        self.group2_df = None
+        self.group3_df = None
+        self.hospital_transfer_df = None
+        self.hospital_transfer_charts = None
+        self.hospital_transfer_analyzer = None
+        gc.collect()
+
+        self.memory_report = {
+            'frames_before': before_frames,
+            'frames_after': self.frame_memory_mb(),
+            'rss_before': before_rss,
+            'rss_after': get_resident_memory_mb()
+        }
+        self.print_memory_report()
+
+    def print_memory_report(self):
+        """메모리 보고서 출력 (저메모리 모드가 아니면 현재 상태만 출력)"""
+        report = self.memory_report or {'frames_after': self.frame_memory_mb(), 'rss_after': get_resident_memory_mb()}
+        frames_before = report.get('frames_before')
+
+        print("[INFO] 메모리 보고서" + (" (저메모리 모드)" if self.low_memory else ""))
+        for name, after in report['frames_after'].items():
+            if frames_before is not None:
+                print(f"  {name:<20} {frames_before[name]:>9.2f} MB -> {after:>9.2f} MB")
+            else:
+                print(f"  {name:<20} {after:>9.2f} MB")
+        if self.low_memory and self.cache_reloads:
+            print("  * reloaded_frames: 병원별 상세 조회 시 다시 읽은 원본 컬럼(연월·수치·병원분류)을 그룹별로 계속 보관 "
+                  "(--no-reload-cache로 끄면 선택마다 디스크에서 읽음)")
+
+        rss_before, rss_after = report.get('rss_before'), report['rss_after']
+        if rss_after is None:
+            print("  RSS: 측정 불가 (psutil 미설치, /proc 없음)")
+        elif rss_before is not None:
+            print(f"  RSS: {rss_before:,.1f} MB -> {rss_after:,.1f} MB ({rss_after - rss_before:+,.1f} MB)")
+        else:
+            print(f"  RSS: {rss_after:,.1f} MB")
+
+    def frame_digest(self, df):
+        """데이터프레임 내용 해시"""
+        digest = hashlib.sha1()
+        if df is None or df.empty:
+            digest.update(b'empty')
+            return digest.hexdigest()
+
+        digest.update('|'.join(map(str, df.columns)).encode('utf-8'))
+        try:
+            digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        except TypeError:
+            # 해시 불가능한 셀이 있으면 문자열 표현으로 대체
+            digest.update(df.astype(str).to_csv(index=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def compute_dataset_fingerprint(self):
+        """로드된 데이터셋의 내용 기반 지문(fingerprint) 계산
+
+        그룹1/2/3은 로더의 후처리(내원일시 대체값 등)가 섞이지 않도록 원본 파일 바이트 해시를 사용하여
+        같은 파일이면 재시작해도 지문(ETag, 정적 내보내기 매니페스트)이 유지된다.
+        """
+        digest = hashlib.sha1()
+        for group in ['group1', 'group2', 'group3']:
+            digest.update(self.source_digests[group].encode('ascii'))
+        digest.update(self.frame_digest(self.hospital_transfer_df).encode('ascii'))
+        return digest.hexdigest()[:16]
+
+    def compute_hospital_fingerprint(self):
+        """병원 사전(표시 이름, hosp_list.json 정보) 지문 - 데이터셋 지문에 없는 hosp_list.json/병원ID 레지스트리 변경 감지용"""
+        body = json.dumps([self.hospital_labels, sorted(self.hospital_info.items())], ensure_ascii=False, default=str)
+        return hashlib.sha1(body.encode('utf-8')).hexdigest()[:16]
+
+    def init_api_aggregates(self):
+        """JSON API 응답을 사전 집계하여 직렬화/압축까지 미리 수행"""
+        try:
+            payloads = {
+                'group1/monthly': self.region_month_payload('group1_monthly', self.group1_numeric_cols),
+                'group2/monthly': self.region_month_payload('group2_monthly', self.group2_numeric_cols),
+                'group3/classification': [
+                    {'병원분류': name, '건수': count}
+                    for name, count in self.view_aggregates['group3_classification'].items()
+                ],
+                'hospital-transfer/monthly': self.aggregate_hospital_transfer_series()
+            }
+            payloads['hospitals'] = [
+                {'병원ID': hospital_id, '병원명': name, **self.hospital_info.get(hospital_id, {})}
+                for hospital_id, name in enumerate(self.hospital_names)
+            ]
+            payloads['meta'] = {
+                'endpoints': [f"/api/v1/{name}" for name in payloads],
+                'records': {
+                    'group1': self.view_aggregates['summary']['group1_records'],
+                    'group2': self.view_aggregates['summary']['group2_records'],
+                    'group3': self.view_aggregates['summary']['group3_records']
+                },
+                # 같은 이름의 병원이 여럿이고 지역으로도 구분되지 않아 병원ID를 붙이지 못한 이름 → 후보 병원ID
+                'ambiguous_hospital_names': self.ambiguous_hospital_names
+            }
+
+            # 모든 응답이 직렬화된 뒤에만 교체 - 하나라도 실패하면 전체를 비워 두어 API가 503을 반환
+            api_payloads = {}
+            for name, data in payloads.items():
+                # NaN/Infinity는 유효한 JSON이 아니므로 기록하지 않고 예외로 처리
+                body = json.dumps(
+                    {'fingerprint': self.dataset_fingerprint, 'data': data},
+                    ensure_ascii=False,
+                    allow_nan=False,
+                    default=self._json_default
+                ).encode('utf-8')
+                api_payloads[name] = {
+                    'etag': f"{self.dataset_fingerprint}-{hashlib.sha1(body).hexdigest()[:8]}",
+                    'body': body,
+                    'gzip': gzip.compress(body, compresslevel=6)
+                }
+            self.api_payloads = api_payloads
+            print(f"[OK] API 사전 집계 완료: {len(self.api_payloads)}개 엔드포인트")
+        except Exception as e:
+            print(f"[WARNING] API 사전 집계 실패: {e}")
+
+    @staticmethod
+    def _json_default(value):
+        """numpy/pandas 값을 JSON 직렬화 가능한 값으로 변환"""
+        if value is pd.NA or value is pd.NaT:
+            return None
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        return str(value)
+
+    def region_month_payload(self, key, value_cols):
+        """지역 × 연월 합계 및 연월별 전체 합계 (API 응답용)"""
+        aggregate = self.view_aggregates[key]
+        if aggregate.empty:
+            return {'regions': [], 'total': []}
+
+        value_cols = [col for col in value_cols if col in aggregate.columns]
+        return {
+            'regions': aggregate.dropna(subset=['지역', '연월']).to_dict(orient='records'),
+            'total': self.get_monthly_series(key, '전체', value_cols).to_dict(orient='records')
+        }
+
+    def aggregate_hospital_transfer_series(self):
+        """기관유형별 병원사정 전원율 월별 시계열 (차트 트레이스 기준)"""
+        series = {}
+        for institution_type, fig in self.hospital_transfer_figures.items():
+            series[institution_type] = [
+                {
+                    'name': trace.name,
+                    'x': [None if pd.isna(value) else value for value in trace.x] if trace.x is not None else [],
+                    'y': [None if pd.isna(value) else value for value in trace.y] if trace.y is not None else []
+                }
+                for trace in fig.data
+            ]
+        return series
+
+    def setup_api_routes(self):
+        """Dash Flask 서버에 읽기 전용 JSON API 등록 (ETag/304/gzip 지원)"""
+        server = self.app.server
+
+        def error_response(message, status):
+            return Response(json.dumps({'error': message}, ensure_ascii=False), status=status, mimetype='application/json')
+
+        def serve_api(name):
+            # 사전 집계가 실패해 응답이 하나도 없으면 엔드포인트 부재(404)가 아니라 일시적 서비스 불가
+            if not self.api_payloads:
+                return error_response("API 사전 집계 실패로 데이터를 제공할 수 없습니다", 503)
+
+            payload = self.api_payloads.get(name)
+            if payload is None:
+                return error_response(f"알 수 없는 엔드포인트: {name}", 404)
+
+            if request.if_none_match.contains_weak(payload['etag']):
+                response = Response(status=304)
+            elif request.accept_encodings.quality('gzip') > 0:
+                response = Response(payload['gzip'], mimetype='application/json')
+                response.headers['Content-Encoding'] = 'gzip'
+            else:
+                response = Response(payload['body'], mimetype='application/json')
+
+            response.set_etag(payload['etag'], weak=True)
+            response.headers['Vary'] = 'Accept-Encoding'
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+
+        server.add_url_rule('/api/v1/<path:name>', 'dashboard_api', serve_api, methods=['GET'])
+
     def get_standard_region_order(self):
         """표준 지역 순서 반환"""
         return ['전체', '서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종',
                 '경기', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
 
+    def get_tab_definitions(self):
+        """탭 (값, 라벨) 목록 반환"""
+        return [
+            ('overview', '전체 개요'),
+            ('group1', '응급진료결과'),
+            ('group2', '119 중증환자 전원율'),
+            ('transfer_ranking', '병원별 전원율 순위'),
+            ('group3', '센터급 vs 기관급 분석'),
+            ('monthly_trends', '월별 트렌드 비교'),
+            ('regional_analysis', '지역별 심화 분석'),
+            ('hospital_transfer_analysis', '병원사정 전원분석'),
+            ('hospital_drilldown', '병원별 상세')
+        ]
+
     def setup_layout(self):
         """대시보드 레이아웃 설정"""
         print("setup_layout 시작")
@@ -258,13 +964,8 @@ class DarkModeDashboard:
                     id='main-tabs',
                     value='overview',
                     children=[
-                        dcc.Tab(label='전체 개요', value='overview'),
-                        dcc.Tab(label='응급진료결과', value='group1'),
-                        dcc.Tab(label='119 중증환자 전원율', value='group2'),
-                        dcc.Tab(label='센터급 vs 기관급 분석', value='group3'),
-                        dcc.Tab(label='월별 트렌드 비교', value='monthly_trends'),
-                        dcc.Tab(label='지역별 심화 분석', value='regional_analysis'),
-                        dcc.Tab(label='병원사정 전원분석', value='hospital_transfer_analysis')
+                        dcc.Tab(label=label, value=value)
+                        for value, label in self.get_tab_definitions()
                     ],
                     style={
                         'backgroundColor': self.dark_grid,
@@ -308,21 +1009,7 @@ class DarkModeDashboard:
             try:
                 print(f"render_content 호출: {active_tab}, {selected_region}")
 
-                if active_tab == 'overview':
-                    return self.render_overview(selected_region)
-                elif active_tab == 'group1':
-                    return self.render_group1(selected_region)
-                elif active_tab == 'group2':
-                    return self.render_group2(selected_region)
-                elif active_tab == 'group3':
-                    return self.render_group3(selected_region)
-                elif active_tab == 'monthly_trends':
-                    return self.render_monthly_trends(selected_region)
-                elif active_tab == 'regional_analysis':
-                    return self.render_regional_analysis()
-                elif active_tab == 'hospital_transfer_analysis':
-                    return self.render_hospital_transfer()
-
+                return self.render_tab(active_tab, selected_region)
             except Exception as e:
                 print(f"render_content 에러: {e}")
                 import traceback
@@ -330,21 +1017,63 @@ class DarkModeDashboard:
                 return html.Div(f"에러 발생: {str(e)}",
                                style={'color': self.accent_red, 'padding': '20px'})
 
+        @self.app.callback(
+            Output('transfer-ranking-graph', 'figure'),
+            [Input('transfer-ranking-months', 'value'),
+             Input('transfer-ranking-min-patients', 'value'),
+             Input('transfer-ranking-top-k', 'value')],
+            State('region-selector', 'value')
+        )
+        def update_transfer_ranking(month_range, min_patients, top_k, selected_region):
+            return self.create_transfer_ranking_chart(selected_region, month_range, min_patients, top_k)
+
+        @self.app.callback(
+            Output('hospital-drilldown-content', 'children'),
+            Input('hospital-selector', 'value')
+        )
+        def render_hospital_detail(hospital_id):
+            try:
+                return self.render_hospital_detail(hospital_id)
+            except Exception as e:
+                print(f"render_hospital_detail 에러: {e}")
+                return html.Div(f"에러 발생: {str(e)}",
+                               style={'color': self.accent_red, 'padding': '20px'})
+
+    def render_tab(self, active_tab, selected_region):
+        """탭 값에 해당하는 렌더링 메서드 호출 (콜백/정적 내보내기 공용)"""
+        if active_tab == 'overview':
+            return self.render_overview(selected_region)
+        elif active_tab == 'group1':
+            return self.render_group1(selected_region)
+        elif active_tab == 'group2':
+            return self.render_group2(selected_region)
+        elif active_tab == 'transfer_ranking':
+            return self.render_transfer_ranking(selected_region)
+        elif active_tab == 'group3':
+            return self.render_group3(selected_region)
+        elif active_tab == 'monthly_trends':
+            return self.render_monthly_trends(selected_region)
+        elif active_tab == 'regional_analysis':
+            return self.render_regional_analysis()
+        elif active_tab == 'hospital_transfer_analysis':
+            return self.render_hospital_transfer()
+        elif active_tab == 'hospital_drilldown':
+            return self.render_hospital_drilldown()
+
     def render_overview(self, selected_region):
         """전체 개요 렌더링"""
         try:
-            # 통계 계산
-            group1_total_patients = self.group1_df['전체'].sum() if not self.group1_df.empty else 0
-            group1_hospitals = self.group1_df['의료기관명'].nunique() if not self.group1_df.empty else 0
+            # 통계 (사전 집계)
+            summary = self.view_aggregates['summary']
+            group1_total_patients = summary['group1_total_patients']
+            group1_hospitals = summary['group1_hospitals']
 
-            group2_total_patients = self.group2_df['119구급차_중증응급환자수'].sum() if not self.group2_df.empty else 0
-            group2_hospitals = self.group2_df['의료기관명'].nunique() if not self.group2_df.empty else 0
+            group2_total_patients = summary['group2_total_patients']
+            group2_hospitals = summary['group2_hospitals']
 
-            group3_records = len(self.group3_df) if not self.group3_df.empty else 0
+            group3_records = summary['group3_records']
 
-            date_range = "N/A"
-            if not self.group1_df.empty and '연월' in self.group1_df.columns:
-                date_range = f"{self.group1_df['연월'].min()} ~ {self.group1_df['연월'].max()}"
+            date_range = summary['date_range']
 
             return html.Div([
                 html.H2("응급의료 통계 개요", style={'color': self.dark_text, 'text-align': 'center', 'margin-bottom': '30px'}),
@@ -352,7 +1081,7 @@ class DarkModeDashboard:
                 # 카드형 통계
                 html.Div([
                     html.Div([
-                        html.H3(f"{len(self.group1_df):,}",
+                        html.H3(f"{summary['group1_records']:,}",
                                style={'color': self.accent_blue, 'margin': '0', 'fontSize': '32px'}),
                         html.P("Group 1 레코드", style={'color': self.dark_text, 'margin': '10px 0 5px 0'}),
                         html.P(f"{group1_hospitals:,}개 기관", style={'color': '#aaa', 'margin': '0', 'fontSize': '12px'})
@@ -367,7 +1096,7 @@ class DarkModeDashboard:
                     }),
 
                     html.Div([
-                        html.H3(f"{len(self.group2_df):,}",
+                        html.H3(f"{summary['group2_records']:,}",
                                style={'color': self.accent_green, 'margin': '0', 'fontSize': '32px'}),
                         html.P("Group 2 레코드", style={'color': self.dark_text, 'margin': '10px 0 5px 0'}),
                         html.P(f"{group2_hospitals:,}개 기관", style={'color': '#aaa', 'margin': '0', 'fontSize': '12px'})
@@ -444,18 +1173,12 @@ class DarkModeDashboard:
 
     def create_group1_monthly_chart(self, selected_region):
         """Group 1 월별 차트"""
-        if self.group1_df.empty:
+        if self.view_aggregates['group1_monthly'].empty:
             return go.Figure().add_annotation(text="데이터 없음", xref="paper", yref="paper",
                                              x=0.5, y=0.5, showarrow=False,
                                              font=dict(color=self.dark_text))
 
-        df = self.group1_df.copy()
-
-        if selected_region != '전체':
-            df = df[df['지역'] == selected_region]
-
-        monthly = df.groupby('연월')['전체'].sum().reset_index()
-        monthly = monthly.sort_values('연월')
+        monthly = self.get_monthly_series('group1_monthly', selected_region, ['전체'])
 
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -491,21 +1214,12 @@ class DarkModeDashboard:
 
     def create_group2_transfer_chart(self, selected_region):
         """Group 2 전원율 차트"""
-        if self.group2_df.empty:
+        if self.view_aggregates['group2_monthly'].empty:
             return go.Figure().add_annotation(text="데이터 없음", xref="paper", yref="paper",
                                              x=0.5, y=0.5, showarrow=False,
                                              font=dict(color=self.dark_text))
 
-        df = self.group2_df.copy()
-
-        if selected_region != '전체':
-            df = df[df['지역'] == selected_region]
-
-        monthly = df.groupby('연월').agg({
-            '119구급차_중증응급환자수': 'sum',
-            '119구급차_중증응급환자_전원수': 'sum'
-        }).reset_index()
-        monthly = monthly.sort_values('연월')
+        monthly = self.get_monthly_series('group2_monthly', selected_region, self.group2_numeric_cols)
 
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -534,19 +1248,162 @@ class DarkModeDashboard:
 
         return self.apply_dark_theme(fig)
 
+    def compute_transfer_ranking(self, selected_region, month_range=None, min_patients=30, top_k=20, z=1.96):
+        """병원별 119 중증응급환자 전원율 상위 k개 (Wilson 신뢰구간 포함)
+
+        그룹2 전체 행에 대해 지역/기간 마스크와 병원ID별 bincount를 한 번에 수행하고,
+        전체 정렬 대신 partition으로 k번째 전원율을 구해 그 이상인 병원만 정렬한다.
+        """
+        columns = ['병원ID', '병원명', '환자수', '전원수', '전원율', '하한', '상한']
+        arrays = self.group2_arrays
+        if arrays is None:
+            return pd.DataFrame(columns=columns)
+
+        last_month = len(arrays['months']) - 1
+        start, end = month_range if month_range else (0, last_month)
+        mask = (
+            (arrays['month'] >= 0) & (arrays['month'] >= start) & (arrays['month'] <= end)
+            & (arrays['hospital'] >= 0)
+        )
+        if selected_region != '전체':
+            region_code = arrays['regions'].get(selected_region)
+            if region_code is None:
+                return pd.DataFrame(columns=columns)
+            mask &= arrays['region'] == region_code
+
+        hospital = arrays['hospital'][mask]
+        n_hospitals = len(self.hospital_names)
+        patients = np.bincount(hospital, weights=arrays['patients'][mask], minlength=n_hospitals)
+        transfers = np.bincount(hospital, weights=arrays['transfers'][mask], minlength=n_hospitals)
+
+        eligible = np.flatnonzero(patients >= max(min_patients or 0, 1))
+        k = min(max(int(top_k or 0), 0), len(eligible))
+        if k == 0:
+            return pd.DataFrame(columns=columns)
+
+        rates = transfers[eligible] / patients[eligible]
+        # k번째 전원율과 같은 병원이 여럿이면 모두 후보에 넣고 (전원율, 환자수, 병원ID) 순으로 정렬 후 k개로 자름
+        kth_rate = -np.partition(-rates, k - 1)[k - 1]
+        top = np.flatnonzero(rates >= kth_rate)
+        top = top[np.lexsort((-patients[eligible][top], -rates[top]))][:k]
+
+        hospital_ids = eligible[top]
+        n = patients[hospital_ids]
+        p = np.clip(rates[top], 0.0, 1.0)
+        denominator = 1 + z ** 2 / n
+        center = (p + z ** 2 / (2 * n)) / denominator
+        half_width = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+
+        return pd.DataFrame({
+            '병원ID': hospital_ids,
+            '병원명': [self.hospital_labels[hospital_id] for hospital_id in hospital_ids],
+            '환자수': n,
+            '전원수': transfers[hospital_ids],
+            '전원율': rates[top],
+            '하한': np.clip(center - half_width, 0.0, 1.0),
+            '상한': np.clip(center + half_width, 0.0, 1.0)
+        })
+
+    def create_transfer_ranking_chart(self, selected_region, month_range=None, min_patients=30, top_k=20):
+        """병원별 전원율 순위 차트"""
+        ranking = self.compute_transfer_ranking(selected_region, month_range, min_patients, top_k)
+        if ranking.empty:
+            return go.Figure().add_annotation(text="조건에 맞는 병원이 없습니다", xref="paper", yref="paper",
+                                             x=0.5, y=0.5, showarrow=False,
+                                             font=dict(color=self.dark_text))
+
+        fig = go.Figure(go.Bar(
+            x=ranking['전원율'] * 100,
+            y=ranking['병원명'],
+            orientation='h',
+            marker=dict(color=self.accent_red, line=dict(color=self.dark_text, width=1)),
+            error_x=dict(
+                type='data',
+                symmetric=False,
+                array=(ranking['상한'] - ranking['전원율']).clip(lower=0) * 100,
+                arrayminus=(ranking['전원율'] - ranking['하한']).clip(lower=0) * 100,
+                color=self.dark_text
+            ),
+            customdata=ranking[['환자수', '전원수', '하한', '상한']].to_numpy(),
+            hovertemplate=(
+                '<b>%{y}</b><br>전원율: %{x:.1f}%<br>'
+                '95% CI: %{customdata[2]:.1%} ~ %{customdata[3]:.1%}<br>'
+                '전원수/환자수: %{customdata[1]:,.0f}/%{customdata[0]:,.0f}<extra></extra>'
+            )
+        ))
+
+        # 조회 조건(기간, 최소 환자수)을 제목에 표시 - 컨트롤이 없는 정적 내보내기에서도 기준이 드러나도록
+        months = self.group2_arrays['months']
+        start, end = month_range if month_range else (0, len(months) - 1)
+        fig.update_layout(
+            title=(f"{selected_region} - 119 중증응급환자 전원율 상위 {len(ranking)}개 병원"
+                   f"<br><sup>{months[start]} ~ {months[end]}, 환자수 {max(min_patients or 0, 1):,}명 이상</sup>"),
+            xaxis_title="전원율 (%)",
+            yaxis_title="병원"
+        )
+
+        fig = self.apply_dark_theme(fig)
+        fig.update_layout(
+            height=max(500, 28 * len(ranking) + 150),
+            hovermode='closest',
+            margin=dict(l=220, r=40, t=80, b=50)
+        )
+        fig.update_yaxes(autorange='reversed')
+        return fig
+
+    def render_transfer_ranking(self, selected_region):
+        """병원별 전원율 순위 렌더링"""
+        if self.group2_arrays is None or not self.group2_arrays['months']:
+            return html.Div([
+                html.H2("병원별 전원율 순위", style={'color': self.dark_text}),
+                html.P("데이터가 없습니다.", style={'color': self.accent_red})
+            ], style={'padding': '20px'})
+
+        months = self.group2_arrays['months']
+        last_month = len(months) - 1
+        marks = {i: str(months[i]) for i in range(0, len(months), max(1, len(months) // 8))}
+        marks[last_month] = str(months[last_month])
+
+        return html.Div([
+            html.H2("병원별 전원율 순위", style={'color': self.dark_text}),
+            html.Div([
+                html.Label("기간:", style={'color': self.dark_text, 'font-weight': 'bold'}),
+                dcc.RangeSlider(
+                    id='transfer-ranking-months',
+                    min=0,
+                    max=last_month,
+                    step=1,
+                    value=[0, last_month],
+                    marks=marks
+                ),
+                html.Div([
+                    html.Label("최소 환자수:", style={'color': self.dark_text, 'font-weight': 'bold', 'margin-right': '10px'}),
+                    dcc.Input(id='transfer-ranking-min-patients', type='number', min=1, value=30,
+                              style={'width': '100px', 'margin-right': '30px'}),
+                    html.Label("상위:", style={'color': self.dark_text, 'font-weight': 'bold', 'margin-right': '10px'}),
+                    dcc.Input(id='transfer-ranking-top-k', type='number', min=1, max=200, value=20,
+                              style={'width': '100px'})
+                ], style={'display': 'flex', 'align-items': 'center', 'margin-top': '20px'})
+            ], id='transfer-ranking-controls', style={'margin-bottom': '20px'}),
+            dcc.Graph(
+                id='transfer-ranking-graph',
+                figure=self.create_transfer_ranking_chart(selected_region, [0, last_month]),
+                style={'marginTop': '20px'}
+            )
+        ], style={'padding': '20px'})
+
     def render_group3(self, selected_region):
         """센터급 vs 기관급 분석 렌더링"""
         try:
-            if self.group3_df.empty:
+            if self.view_aggregates['summary']['group3_records'] == 0:
                 return html.Div([
                     html.H2("센터급 vs 기관급 분석", style={'color': self.dark_text}),
                     html.P("데이터가 없습니다.", style={'color': self.accent_red})
                 ], style={'padding': '20px'})
 
-            # 병원분류별 환자수 집계
-            if '병원분류' in self.group3_df.columns:
-                classification_counts = self.group3_df['병원분류'].value_counts()
-
+            # 병원분류별 환자수 집계 (사전 집계)
+            classification_counts = self.view_aggregates['group3_classification']
+            if not classification_counts.empty:
                 fig = go.Figure(data=[
                     go.Bar(
                         x=classification_counts.index,
@@ -585,21 +1442,13 @@ class DarkModeDashboard:
         """월별 트렌드 비교 렌더링"""
         try:
             # Group 1 월별 추이
-            if not self.group1_df.empty and '연월' in self.group1_df.columns:
-                df1 = self.group1_df.copy()
-                if selected_region != '전체':
-                    df1 = df1[df1['지역'] == selected_region]
-
-                monthly1 = df1.groupby('연월')['전체'].sum().reset_index().sort_values('연월')
+            if not self.view_aggregates['group1_monthly'].empty:
+                monthly1 = self.get_monthly_series('group1_monthly', selected_region, ['전체'])
 
                 # Group 2 월별 추이
-                df2 = self.group2_df.copy()
-                if selected_region != '전체':
-                    df2 = df2[df2['지역'] == selected_region]
-
-                monthly2 = df2.groupby('연월').agg({
-                    '119구급차_중증응급환자수': 'sum'
-                }).reset_index().sort_values('연월')
+                monthly2 = self.get_monthly_series('group2_monthly', selected_region, ['119구급차_중증응급환자수'])
+                if monthly2.empty:
+                    monthly2 = pd.DataFrame(columns=['연월', '119구급차_중증응급환자수'])
 
                 fig = make_subplots(
                     rows=2, cols=1,
@@ -661,14 +1510,14 @@ class DarkModeDashboard:
     def render_regional_analysis(self):
         """지역별 심화 분석 렌더링"""
         try:
-            if self.group1_df.empty:
+            if self.view_aggregates['group1_monthly'].empty:
                 return html.Div([
                     html.H2("지역별 심화 분석", style={'color': self.dark_text}),
                     html.P("데이터가 없습니다.", style={'color': self.accent_red})
                 ], style={'padding': '20px'})
 
-            # 지역별 환자수 집계
-            regional_data = self.group1_df.groupby('지역')['전체'].sum().reset_index()
+            # 지역별 환자수 집계 (지역 × 연월 사전 집계 기준)
+            regional_data = self.view_aggregates['group1_monthly'].groupby('지역')['전체'].sum().reset_index()
             regional_data = regional_data.sort_values('전체', ascending=False)
 
             fig = go.Figure(data=[
@@ -704,7 +1553,7 @@ class DarkModeDashboard:
     def render_hospital_transfer(self):
         """병원사정 전원 분석 렌더링"""
         try:
-            if self.hospital_transfer_analyzer is None or self.hospital_transfer_charts is None:
+            if not self.hospital_transfer_figures:
                 return html.Div([
                     html.H2("병원사정 전원 분석", style={'color': self.dark_text}),
                     html.P("병원사정 분석 데이터를 로드할 수 없습니다.",
@@ -713,8 +1562,7 @@ class DarkModeDashboard:
 
             # 병원사정 전원율 월별 트렌드
             try:
-                fig = self.hospital_transfer_charts.create_monthly_trend_chart(institution_type='전체')
-                fig = self.apply_dark_theme(fig)
+                fig = self.apply_dark_theme(go.Figure(self.hospital_transfer_figures['전체']))
 
                 return html.Div([
                     html.H2("병원사정 전원 분석", style={'color': self.dark_text}),
@@ -743,6 +1591,112 @@ class DarkModeDashboard:
         except Exception as e:
             return html.Div(f"에러: {str(e)}", style={'color': self.accent_red, 'padding': '20px'})
 
+    def render_hospital_drilldown(self):
+        """병원별 상세 (세 그룹 통합 드릴다운) 렌더링"""
+        present = np.zeros(len(self.hospital_names), dtype=bool)
+        for index in self.hospital_row_index.values():
+            present |= np.diff(index['offsets']) > 0
+
+        options = sorted(
+            ({'label': self.hospital_labels[hospital_id], 'value': int(hospital_id)}
+             for hospital_id in np.flatnonzero(present)),
+            key=lambda option: option['label']
+        )
+
+        return html.Div([
+            html.H2("병원별 상세", style={'color': self.dark_text}),
+            html.Div([
+                html.Label("병원 선택:", style={'color': self.dark_text, 'font-weight': 'bold'}),
+                dcc.Dropdown(
+                    id='hospital-selector',
+                    options=options,
+                    value=options[0]['value'] if options else None,
+                    style={'width': '400px'}
+                )
+            ], style={'margin-bottom': '20px'}),
+            html.Div(id='hospital-drilldown-content')
+        ], style={'padding': '20px'})
+
+    def render_hospital_detail(self, hospital_id):
+        """선택한 병원의 그룹1/2/3 데이터를 행 오프셋 인덱스로 조회해 렌더링"""
+        if hospital_id is None:
+            return html.P("병원을 선택하세요.", style={'color': self.dark_text})
+
+        def hospital_rows(group):
+            df = self.get_group_frame(group)
+            return df.iloc[self.get_hospital_rows(group, hospital_id)] if not df.empty else df
+
+        group1, group2, group3 = (hospital_rows(group) for group in ['group1', 'group2', 'group3'])
+
+        fig = make_subplots(
+            rows=2, cols=1,
+            subplot_titles=("응급진료결과 월별 환자수", "119 중증응급환자 월별 추이"),
+            vertical_spacing=0.15
+        )
+
+        if not group1.empty:
+            monthly1 = group1.groupby('연월')['전체'].sum().reset_index().sort_values('연월')
+            fig.add_trace(
+                go.Scatter(
+                    x=monthly1['연월'],
+                    y=monthly1['전체'],
+                    mode='lines+markers',
+                    name='응급진료 환자수',
+                    line=dict(color=self.accent_blue, width=3),
+                    marker=dict(size=8)
+                ),
+                row=1, col=1
+            )
+
+        if not group2.empty:
+            monthly2 = group2.groupby('연월')[self.group2_numeric_cols].sum().reset_index().sort_values('연월')
+            fig.add_trace(
+                go.Scatter(
+                    x=monthly2['연월'],
+                    y=monthly2['119구급차_중증응급환자수'],
+                    mode='lines+markers',
+                    name='119 중증환자수',
+                    line=dict(color=self.accent_green, width=3),
+                    marker=dict(size=8)
+                ),
+                row=2, col=1
+            )
+            fig.add_trace(
+                go.Scatter(
+                    x=monthly2['연월'],
+                    y=monthly2['119구급차_중증응급환자_전원수'],
+                    mode='lines+markers',
+                    name='전원수',
+                    line=dict(color=self.accent_red, width=3),
+                    marker=dict(size=8)
+                ),
+                row=2, col=1
+            )
+
+        fig.update_layout(height=800, showlegend=True)
+        fig = self.apply_dark_theme(fig)
+
+        info = self.hospital_info.get(hospital_id, {})
+        classification = ', '.join(
+            f"{name} {count:,}건" for name, count in group3['병원분류'].value_counts().items()
+        ) if not group3.empty else '없음'
+
+        return html.Div([
+            html.Div([
+                html.H3(self.hospital_labels[hospital_id], style={'color': self.accent_blue, 'marginTop': '0'}),
+                html.P(f"{info.get('지역', '-')} · {info.get('의료기관분류', '-')}",
+                       style={'color': '#aaa', 'margin': '0 0 10px 0'}),
+                html.P(f"Group 1 {len(group1):,}건 · Group 2 {len(group2):,}건 · Group 3 {len(group3):,}건 ({classification})",
+                       style={'color': self.dark_text, 'margin': '0'})
+            ], style={
+                'backgroundColor': self.dark_grid,
+                'padding': '25px',
+                'borderRadius': '8px',
+                'borderLeft': f'4px solid {self.accent_blue}'
+            }),
+            dcc.Graph(figure=fig, style={'marginTop': '20px'})
+        ])
+
     def run(self):
         """대시보드 실행"""
         print("[INFO] 다크모드 대시보드 시작 중...")
@@ -750,5 +1704,24 @@ class DarkModeDashboard:
 
 
 if __name__ == '__main__':
-    dashboard = DarkModeDashboard()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="다크모드 통합 대시보드")
+    parser.add_argument('--export', metavar='DIR',
+                        help="대시보드를 실행하지 않고 모든 탭 × 지역을 정적 HTML/JSON으로 내보내기")
+    parser.add_argument('--workers', type=int, default=None, help="정적 내보내기 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument('--force', action='store_true', help="데이터셋 지문이 같아도 모두 다시 렌더링")
+    parser.add_argument('--low-memory', action='store_true',
+                        help="집계 결과만 상주시키고 원본 데이터는 해제 (병원별 상세는 디스크에서 다시 읽음)")
+    parser.add_argument('--no-reload-cache', action='store_true',
+                        help="저메모리 모드에서 병원별 상세용 원본 컬럼을 캐시하지 않음 (선택마다 디스크에서 읽음)")
+    parser.add_argument('--memory-report', action='store_true', help="시작 후 메모리 보고서 출력")
+    args = parser.parse_args()
+
+    dashboard = DarkModeDashboard(low_memory=args.low_memory, cache_reloads=not args.no_reload_cache)
+    if args.memory_report and not args.low_memory:
+        dashboard.print_memory_report()
+    if args.export:
+        from static_export import export_static
+        raise SystemExit(1 if export_static(dashboard, args.export, workers=args.workers, force=args.force) else 0)
     dashboard.run()
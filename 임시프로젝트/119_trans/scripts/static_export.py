@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+다크모드 대시보드 정적 내보내기
+모든 탭 × 지역 조합을 독립 HTML / Figure JSON으로 프로세스 풀에서 병렬 렌더링
+"""
+
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from html import escape
+from urllib.parse import quote
+
+import plotly
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+from dash import dcc
+
+# 지역과 무관한 병원 단위 화면은 정적 내보내기 대상에서 제외
+EXCLUDED_TABS = {'hospital_drilldown'}
+
+# 지역 선택과 무관한 탭은 '전체'로 한 번만 렌더링하고 모든 지역 칸이 같은 파일을 가리킴
+REGION_INDEPENDENT_TABS = {'overview', 'group3', 'regional_analysis', 'hospital_transfer_analysis'}
+
+# 입력 컨트롤 묶음 (정적 HTML에서는 라벨까지 통째로 생략, 기본 조회 조건은 차트 제목에 표시됨)
+CONTROL_BLOCK_IDS = {'transfer-ranking-controls'}
+
+# 렌더링에 쓰는 대시보드 인스턴스 (fork된 워커는 부모의 인스턴스와 사전 집계를 그대로 상속)
+_dashboard = None
+
+
+def style_to_css(style):
+    """Dash style 딕셔너리를 CSS 문자열로 변환 (camelCase → kebab-case)"""
+    return '; '.join(
+        f"{re.sub(r'([A-Z])', lambda m: '-' + m.group(1).lower(), key)}: {value}"
+        for key, value in style.items()
+    )
+
+
+def component_to_html(component):
+    """Dash 컴포넌트 트리를 정적 HTML로 변환 (그래프는 Plotly div, 입력 컨트롤은 생략)"""
+    if component is None:
+        return ''
+    if isinstance(component, (list, tuple)):
+        return ''.join(component_to_html(child) for child in component)
+    if isinstance(component, (str, int, float)):
+        return escape(str(component))
+    if isinstance(component, dcc.Graph):
+        figure = getattr(component, 'figure', None)
+        if figure is None:
+            return ''
+        return pio.to_html(figure, full_html=False, include_plotlyjs=False, config={'displaylogo': False})
+    if getattr(component, '_namespace', '') != 'dash_html_components':
+        return ''
+    if getattr(component, 'id', None) in CONTROL_BLOCK_IDS:
+        return ''
+
+    tag = component._type.lower()
+    style = getattr(component, 'style', None)
+    attrs = f' style="{escape(style_to_css(style))}"' if style else ''
+    return f"<{tag}{attrs}>{component_to_html(getattr(component, 'children', None))}</{tag}>"
+
+
+def collect_figures(component):
+    """컴포넌트 트리에서 dcc.Graph figure 목록 수집"""
+    if isinstance(component, (list, tuple)):
+        return [figure for child in component for figure in collect_figures(child)]
+    if isinstance(component, dcc.Graph):
+        figure = getattr(component, 'figure', None)
+        return [figure] if figure is not None else []
+    if hasattr(component, 'children'):
+        return collect_figures(component.children)
+    return []
+
+
+def _source_region(tab, region):
+    """탭/지역 조합이 실제로 렌더링되는 지역 (지역 무관 탭은 '전체')"""
+    return '전체' if tab in REGION_INDEPENDENT_TABS else region
+
+
+def _output_paths(output_dir, tab, region):
+    """탭/지역 조합의 HTML, JSON 출력 경로"""
+    base = os.path.join(output_dir, tab, region)
+    return f"{base}.html", f"{base}.json"
+
+
+def _render_job(tab, label, region, output_dir):
+    """워커에서 탭 하나 × 지역 하나를 렌더링해 파일로 기록"""
+    component = _dashboard.render_tab(tab, region)
+    html_path, json_path = _output_paths(output_dir, tab, region)
+    os.makedirs(os.path.dirname(html_path), exist_ok=True)
+
+    page = (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{escape(label)} - {escape(region)}</title>\n"
+        '<script src="../plotly.min.js"></script>\n</head>\n'
+        f'<body style="margin: 0; background-color: {_dashboard.dark_bg}; '
+        f'color: {_dashboard.dark_text}; font-family: Arial, sans-serif">\n'
+        f"{component_to_html(component)}\n</body>\n</html>\n"
+    )
+    with open(html_path, 'w', encoding='utf-8') as f:
+        f.write(page)
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        f.write('[' + ','.join(pio.to_json(figure) for figure in collect_figures(component)) + ']')
+
+    return tab, region
+
+
+def write_index(dashboard, output_dir, tabs, regions, manifest):
+    """탭 × 지역 링크 표로 구성된 인덱스 페이지 작성"""
+    header = ''.join(f"<th>{escape(region)}</th>" for region in regions)
+    rows = []
+    for tab, label in tabs:
+        sources = [_source_region(tab, region) for region in regions]
+        cells = ''.join(
+            f'<td><a href="{quote(tab)}/{quote(source)}.html" style="color: {dashboard.accent_blue}">HTML</a> · '
+            f'<a href="{quote(tab)}/{quote(source)}.json" style="color: {dashboard.accent_blue}">JSON</a></td>'
+            if f"{tab}/{source}" in manifest['outputs'] else '<td>-</td>'
+            for source in sources
+        )
+        rows.append(f"<tr><th style=\"text-align: left\">{escape(label)}</th>{cells}</tr>")
+
+    page = (
+        '<!DOCTYPE html>\n<html lang="ko">\n<head>\n<meta charset="utf-8">\n'
+        '<title>응급의료 통합 대시보드 - 정적 스냅샷</title>\n</head>\n'
+        f'<body style="margin: 0; padding: 20px; background-color: {dashboard.dark_bg}; '
+        f'color: {dashboard.dark_text}; font-family: Arial, sans-serif">\n'
+        '<h1>응급의료 통합 대시보드 (정적 스냅샷)</h1>\n'
+        f"<p>데이터셋 지문: <code>{escape(manifest['fingerprint'])}</code></p>\n"
+        '<table cellpadding="6" style="border-collapse: collapse; font-size: 13px">\n'
+        f"<tr><th></th>{header}</tr>\n" + '\n'.join(rows) + '\n</table>\n</body>\n</html>\n'
+    )
+    with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(page)
+
+
+def export_static(dashboard, output_dir, workers=None, force=False):
+    """모든 탭 × 지역 조합을 병렬 렌더링 (데이터셋·병원 사전 지문이 같은 기존 출력은 건너뜀)"""
+    global _dashboard
+    _dashboard = dashboard
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, 'manifest.json')
+    # 병원명은 hosp_list.json/병원ID 레지스트리에서 오므로 데이터셋 지문만으로는 출력의 최신 여부를 판단할 수 없음
+    snapshot = f"{dashboard.dataset_fingerprint}-{dashboard.hospital_fingerprint}"
+    manifest = {
+        'fingerprint': dashboard.dataset_fingerprint,
+        'hospitals': dashboard.hospital_fingerprint,
+        'plotly': plotly.__version__,
+        'outputs': {}
+    }
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            previous = json.load(f)
+
+    # plotly 버전이 바뀌면 plotly.min.js와 Figure 출력이 모두 맞지 않으므로 전체를 다시 렌더링
+    plotly_changed = previous.get('plotly') != plotly.__version__
+    if not plotly_changed:
+        manifest['outputs'] = previous.get('outputs', {})
+
+    tabs = [(tab, label) for tab, label in dashboard.get_tab_definitions() if tab not in EXCLUDED_TABS]
+    regions = dashboard.get_standard_region_order()
+
+    jobs = [
+        (tab, label, region)
+        for tab, label in tabs
+        for region in (['전체'] if tab in REGION_INDEPENDENT_TABS else regions)
+    ]
+
+    # 더 이상 만들지 않는 출력(예: 지역 무관 탭의 지역별 사본)은 매니페스트와 디스크에서 제거
+    expected = {f"{tab}/{region}" for tab, _, region in jobs}
+    for key in [key for key in manifest['outputs'] if key not in expected]:
+        del manifest['outputs'][key]
+        tab, region = key.split('/', 1)
+        for path in _output_paths(output_dir, tab, region):
+            if os.path.exists(path):
+                os.remove(path)
+
+    pending = []
+    for tab, label, region in jobs:
+        key = f"{tab}/{region}"
+        fresh = (
+            manifest['outputs'].get(key) == snapshot
+            and all(os.path.exists(path) for path in _output_paths(output_dir, tab, region))
+        )
+        if force or not fresh:
+            manifest['outputs'].pop(key, None)
+            pending.append((tab, label, region))
+
+    plotlyjs_path = os.path.join(output_dir, 'plotly.min.js')
+    if force or plotly_changed or not os.path.exists(plotlyjs_path):
+        with open(plotlyjs_path, 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+
+    print(f"[INFO] 정적 내보내기: {len(pending)}개 렌더링, "
+          f"{len(jobs) - len(pending)}개 변경 없음(건너뜀)")
+
+    # 병렬 렌더링은 fork에 의존: spawn만 있는 플랫폼(Windows 등)에서는 워커마다 전체 데이터를
+    # 다시 로드해야 해 직렬보다 느리므로 현재 프로세스에서 순서대로 렌더링
+    fork_available = 'fork' in multiprocessing.get_all_start_methods()
+    parallel = fork_available and workers != 1 and len(pending) > 1
+    if len(pending) > 1 and not fork_available:
+        print("[INFO] fork 미지원 플랫폼: 현재 프로세스에서 직렬 렌더링")
+
+    failed = 0
+    if parallel:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            futures = {
+                executor.submit(_render_job, tab, label, region, output_dir): f"{tab}/{region}"
+                for tab, label, region in pending
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    future.result()
+                    manifest['outputs'][key] = snapshot
+                except Exception as e:
+                    failed += 1
+                    print(f"[WARNING] {key} 렌더링 실패: {e}")
+    else:
+        for tab, label, region in pending:
+            key = f"{tab}/{region}"
+            try:
+                _render_job(tab, label, region, output_dir)
+                manifest['outputs'][key] = snapshot
+            except Exception as e:
+                failed += 1
+                print(f"[WARNING] {key} 렌더링 실패: {e}")
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    write_index(dashboard, output_dir, tabs, regions, manifest)
+
+    print(f"[OK] 정적 내보내기 완료: {output_dir} (실패 {failed}개)")
+    return failed